@@ -6,6 +6,7 @@ from __future__ import annotations
 import os.path as osp
 import asyncio
 from datetime import datetime
+from functools import lru_cache, cached_property
 from typing import Iterable, Any
 
 # external imports
@@ -13,72 +14,141 @@ import click
 import toga
 from toga.sources import Source
 from toga.style.pack import Pack
-from maestral.models import SyncEvent, ItemType
+from maestral.models import SyncEvent, ItemType, ChangeType
 from maestral.daemon import MaestralProxy
 from maestral.utils import sanitize_string
 
 # local imports
 from .private.widgets import FreestandingIconButton, Icon, Window
 from .private.constants import ImageTemplate
+from .utils import call_async_proxy, create_task
 
 
 PADDING = 10
 ICON_SIZE = 32
 WINDOW_SIZE = (700, 600)
+REFRESH_INTERVAL = 1
+MAX_REFRESH_INTERVAL = 8
+
+_CHANGE_TYPE_LABELS = {c: c.value.capitalize() for c in ChangeType}
+
+
+@lru_cache(maxsize=None)
+def _reveal_icon() -> Icon:
+    # Shared by the reveal buttons of all rows.
+    return Icon(template=ImageTemplate.Reveal)
+
+
+@lru_cache(maxsize=1024)
+def _format_minute(minute: int) -> str:
+    # Times are displayed with minute resolution and many events share a minute.
+    return datetime.fromtimestamp(60 * minute).strftime("%d %b %Y %H:%M")
 
 
 class SyncEventRow:
     _reveal_button: FreestandingIconButton | None
 
-    def __init__(self, sync_event: SyncEvent) -> None:
+    def __init__(
+        self, sync_event: SyncEvent, exists_cache: dict[str, bool] | None = None
+    ) -> None:
         self.sync_event = sync_event
 
-        dirname, basename = osp.split(self.sync_event.local_path)
-        dt = datetime.fromtimestamp(self.sync_event.change_time_or_sync_time)
-
-        # attributes for table column values
-        self.location = osp.basename(dirname)
-        self.type = self.sync_event.change_type.value.capitalize()
-        self.time = dt.strftime("%d %b %Y %H:%M")
-        self.username = self.sync_event.change_user_name
-
-        self._basename = basename
         self._icon: Icon | None = None
         self._reveal_button = None
+        self._exists_cache = {} if exists_cache is None else exists_cache
+
+    # Table column values are computed when the table first displays a row. The
+    # table only requests values for visible rows.
+
+    @cached_property
+    def location(self) -> str:
+        # Paths are always "/" separated on macOS, rpartition is faster than osp.
+        dirname, _, _ = self.sync_event.local_path.rpartition("/")
+        return dirname.rpartition("/")[2]
+
+    @cached_property
+    def type(self) -> str:
+        return _CHANGE_TYPE_LABELS[self.sync_event.change_type]
+
+    @cached_property
+    def time(self) -> str:
+        timestamp = self.sync_event.change_time_or_sync_time
+        return _format_minute(int(timestamp // 60))
+
+    @property
+    def username(self) -> str | None:
+        return self.sync_event.change_user_name
 
     @property
     def filename(self) -> tuple[Icon, str]:
         if not self._icon:
-            if self.sync_event.item_type is ItemType.Folder:
-                self._icon = Icon(for_path="/usr")
-            else:
-                self._icon = Icon(for_path=self.sync_event.local_path)
+            self._icon = Icon.for_file_type(
+                self.sync_event.local_path,
+                is_folder=self.sync_event.item_type is ItemType.Folder,
+            )
 
-        return self._icon, sanitize_string(self._basename)
+        basename = self.sync_event.local_path.rpartition("/")[2]
+        return self._icon, sanitize_string(basename)
 
     @property
     def reveal(self) -> FreestandingIconButton:
         if not self._reveal_button:
             self._reveal_button = FreestandingIconButton(
                 text="",
-                icon=Icon(template=ImageTemplate.Reveal),
+                icon=_reveal_icon(),
                 on_press=self.on_reveal_pressed,
             )
-            self._reveal_button.enabled = osp.exists(self.sync_event.local_path)
+            self._reveal_button.enabled = self._exists()
 
         return self._reveal_button
 
+    def _exists(self) -> bool:
+        # Rows which are created together share a cache, the same path frequently
+        # appears multiple times in the history.
+        path = self.sync_event.local_path
+        try:
+            return self._exists_cache[path]
+        except KeyError:
+            exists = self._exists_cache[path] = osp.exists(path)
+            return exists
+
+    def update(self, sync_event: SyncEvent) -> bool:
+        """
+        Updates the row with a newer version of its sync event.
+
+        :returns: Whether any displayed values changed.
+        """
+        old_event = self.sync_event
+        self.sync_event = sync_event
+
+        changed = (
+            sync_event.change_time_or_sync_time != old_event.change_time_or_sync_time
+            or sync_event.change_type is not old_event.change_type
+            or sync_event.local_path != old_event.local_path
+        )
+
+        if changed:
+            # Clear values which are cached from the previous event.
+            for name in ("location", "type", "time"):
+                self.__dict__.pop(name, None)
+            if sync_event.local_path != old_event.local_path:
+                self._icon = None
+
+        return changed
+
     def on_reveal_pressed(self, widget: Any) -> None:
         click.launch(self.sync_event.local_path, locate=True)
 
     def refresh(self) -> None:
-        self.reveal.enabled = osp.exists(self.sync_event.local_path)
+        self._exists_cache.pop(self.sync_event.local_path, None)
+        self.reveal.enabled = self._exists()
 
 
 class SyncEventSource(Source):
     def __init__(self, sync_events: Iterable[SyncEvent] = tuple()) -> None:
         super().__init__()
-        self._rows = [SyncEventRow(e) for e in sync_events]
+        exists_cache: dict[str, bool] = {}
+        self._rows = [SyncEventRow(e, exists_cache) for e in sync_events]
 
     def __len__(self) -> int:
         return len(self._rows)
@@ -86,6 +156,9 @@ class SyncEventSource(Source):
     def __getitem__(self, index: int) -> SyncEventRow:
         return self._rows[index]
 
+    def index(self, row: SyncEventRow) -> int:
+        return self._rows.index(row)
+
     def add(self, sync_event: SyncEvent) -> None:
         row = SyncEventRow(sync_event)
         self._rows.append(row)
@@ -100,21 +173,57 @@ class SyncEventSource(Source):
         row = self._rows[index]
         self.notify("pre_remove", item=row)
         del self._rows[index]
-        self.notify("remove", item=row)
+        self.notify("remove", index=index, item=row)
 
     def clear(self) -> None:
         self._rows.clear()
         self.notify("clear")
 
+    def update(self, sync_events: Iterable[SyncEvent]) -> bool:
+        """
+        Updates the rows to show the given sync events, in the given order. Rows of
+        events which are already shown are reused. All insertions and removals are
+        applied at once and trigger a single reload of the table. If only the details
+        of existing events changed, just the affected rows are reloaded.
+
+        :returns: Whether any rows were inserted or removed.
+        """
+        sync_events = list(sync_events)
+
+        # Fast path: the same events are shown, compare ids without building new rows.
+        if len(sync_events) == len(self._rows) and all(
+            e.id == row.sync_event.id for e, row in zip(sync_events, self._rows)
+        ):
+            for e, row in zip(sync_events, self._rows):
+                if e is not row.sync_event and row.update(e):
+                    self.notify("change", item=row)
+            return False
+
+        exists_cache: dict[str, bool] = {}
+        rows_by_id = {row.sync_event.id: row for row in self._rows}
+        rows = []
+
+        for e in sync_events:
+            try:
+                row = rows_by_id[e.id]
+            except KeyError:
+                row = SyncEventRow(e, exists_cache)
+            else:
+                row.update(e)
+            rows.append(row)
+
+        self._rows = rows
+        self.notify("change_source", source=self)
+        return True
+
 
 class ActivityWindow(Window):
     def __init__(self, mdbx: MaestralProxy) -> None:
         super().__init__(title="Maestral Activity")
         self.size = WINDOW_SIZE
 
-        self._refresh = False
-        self._refresh_interval = 1
-        self._ids: set[str] = set()
+        self._refresh_task: asyncio.Task | None = None
+        self._refresh_interval = REFRESH_INTERVAL
 
         self.on_close = self.on_close_pressed
 
@@ -142,36 +251,48 @@ class ActivityWindow(Window):
                 message="The file or folder no longer exists.",
             )
 
-    async def periodic_refresh_gui(self, interface, *args, **kwargs) -> None:
-        while self._refresh:
-            await self.refresh_gui()
+    async def periodic_refresh_gui(self) -> None:
+        while True:
+            if await self.refresh_gui():
+                self._refresh_interval = REFRESH_INTERVAL
+            else:
+                # Back off while the history is unchanged.
+                self._refresh_interval = min(
+                    2 * self._refresh_interval, MAX_REFRESH_INTERVAL
+                )
             await asyncio.sleep(self._refresh_interval)
 
-    async def refresh_gui(self) -> None:
-        needs_refresh = False
-
-        for event in self.mdbx.get_history():
-            if event.id not in self._ids:
-                self.table.data.insert(0, event)
-                self._ids.add(event.id)
-                await asyncio.sleep(0.002)
-                needs_refresh = True
+    async def refresh_gui(self) -> bool:
+        # Fetch the history in a worker thread to keep the GUI responsive, reusing its
+        # proxy between refreshes. Rows are cheap to create since their contents are
+        # computed on display.
+        history = await call_async_proxy(
+            self.mdbx.config_name, lambda m: m.get_history()
+        )
 
-        if needs_refresh:
+        # Apply new and dropped events in a single pass to reload the table only once.
+        if self.table.data.update(reversed(history)):
             self.table.refresh()
+            return True
+
+        return False
 
     def on_close_pressed(self, sender: Any = None) -> bool:
-        self._refresh = False
+        # Drop the task so that it does not keep the loaded history alive.
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            self._refresh_task = None
         return True
 
     def show(self) -> None:
         if not self._initial_load:
-            sync_events = self.mdbx.get_history()
-            data_source = SyncEventSource(reversed(sync_events))
-            self._ids = set(event.id for event in sync_events)
-            self.table.data = data_source
+            # The history is loaded by the first periodic refresh.
+            self.table.data = SyncEventSource()
             self._initial_load = True
 
-        self._refresh = True
-        self.app.add_background_task(self.periodic_refresh_gui)
+        # Restart the refresh if it is not running or has failed.
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_interval = REFRESH_INTERVAL
+            self._refresh_task = create_task(self.periodic_refresh_gui())
+
         super().show()
@@ -2,8 +2,8 @@ from __future__ import annotations
 
 # system imports
 import os
-import sys
 import gc
+import asyncio
 from traceback import format_exception
 from subprocess import Popen
 from datetime import datetime, timedelta
@@ -42,7 +42,7 @@ from maestral.exceptions import (
 # local imports
 from . import __version__ as __gui_version__
 from . import __author__, __url__
-from .utils import call_async, call_async_maestral
+from .utils import call_async, call_async_maestral, call_async_proxy, create_task
 from .private.widgets import (
     MenuItem,
     MenuItemSeparator,
@@ -84,14 +84,19 @@ class MaestralGui(SystemTrayApp):
     RESUME_TEXT = "Resume Syncing"
     START_TEXT = "Start Syncing"
 
+    # Minimum time between GUI refreshes in seconds. The status may change many times
+    # per second while syncing.
+    MIN_REFRESH_INTERVAL = 0.5
+    GC_INTERVAL = 30
+
     icon_mapping = {
-        IDLE: Icon(resource_path("systray-idle.pdf")),
-        CONNECTED: Icon(resource_path("systray-idle.pdf")),
-        SYNCING: Icon(resource_path("systray-syncing.pdf")),
-        PAUSED: Icon(resource_path("systray-paused.pdf")),
-        CONNECTING: Icon(resource_path("systray-disconnected.pdf")),
-        SYNC_ERROR: Icon(resource_path("systray-info.pdf")),
-        ERROR: Icon(resource_path("systray-error.pdf")),
+        IDLE: "systray-idle.pdf",
+        CONNECTED: "systray-idle.pdf",
+        SYNCING: "systray-syncing.pdf",
+        PAUSED: "systray-paused.pdf",
+        CONNECTING: "systray-disconnected.pdf",
+        SYNC_ERROR: "systray-info.pdf",
+        ERROR: "systray-error.pdf",
     }
 
     def __init__(self, config_name: str = "maestral") -> None:
@@ -110,26 +115,41 @@ class MaestralGui(SystemTrayApp):
         self._started = False
         self._cached_status = CONNECTING
         self._linked_ui = False
-
-        self.mdbx = self.get_or_start_maestral_daemon()
+        self._refresh_task: asyncio.Task | None = None
+        self._daemon_start: asyncio.Future | None = None
+        self._icons: dict[str, Icon] = {}
+        self._icon_files: dict[str, Icon] = {}
 
         self.autostart = AutoStart(self.config_name)
-        self.updater = AutoUpdater(self.mdbx, self)
 
         self.menu = Menu()
-        self.tray = StatusBarItem(icon=self.icon_mapping[CONNECTING], menu=self.menu)
+        self.tray = StatusBarItem(icon=self._get_icon(CONNECTING), menu=self.menu)
 
         self.setup_ui_unlinked()
 
+        # Starting the daemon may take a few seconds. Show the tray icon meanwhile.
+        self._connect_task: asyncio.Task | None = create_task(
+            self.connect_to_daemon(self)
+        )
+
+    async def connect_to_daemon(self, interface, *args, **kwargs) -> None:
+        mdbx = await self.get_or_start_maestral_daemon()
+
+        if not mdbx:
+            return
+
+        self.mdbx = mdbx
+        self.updater = AutoUpdater(self.mdbx, self)
+
         # Check if we are linked. Run setup if required.
         try:
-            pending_link = self.mdbx.pending_link
+            pending_link, pending_folder = await call_async_proxy(
+                self.config_name, lambda m: (m.pending_link, m.pending_dropbox_folder)
+            )
         except KeyringAccessError:
-            self.add_background_task(self.update_error)
+            await self.update_error(self)
             return
 
-        pending_folder = self.mdbx.pending_dropbox_folder
-
         if pending_link or pending_folder:
             setup_dialog = SetupDialog(mdbx=self.mdbx)
             setup_dialog.show()
@@ -141,26 +161,49 @@ class MaestralGui(SystemTrayApp):
                 setup_dialog.goto_page(2)
 
         else:
-            self.add_background_task(self.on_setup_completed)
+            await self.on_setup_completed(self)
+
+    def _get_icon(self, status: str) -> Icon:
+        # Load icons on first use, only a few of them are typically needed. Unknown
+        # statuses, e.g., while downloading, resolve to the syncing icon once.
+        try:
+            return self._icons[status]
+        except KeyError:
+            pass
+
+        filename = self.icon_mapping.get(status, self.icon_mapping[SYNCING])
+
+        try:
+            icon = self._icon_files[filename]
+        except KeyError:
+            icon = self._icon_files[filename] = Icon(resource_path(filename))
+
+        self._icons[status] = icon
+        return icon
 
     def set_icon(self, status: str) -> None:
         if status != self._cached_status:
-            self.tray.icon = self.icon_mapping.get(status, self.icon_mapping[SYNCING])
+            self.tray.icon = self._get_icon(status)
             self._cached_status = status
 
     async def on_menu_open(self, interface, *args, **kwargs) -> None:
         await self.update_snoozed(self)
+        await self.update_account(self)
         await self.update_status(self)
 
     async def on_setup_completed(self, interface, *args, **kwargs) -> None:
-        self.mdbx.start_sync()
+        await call_async_maestral(self.config_name, "start_sync")
         self.setup_ui_linked()
         self.updater.start_updater()
         self._linked_ui = True
-        await self.periodic_refresh_gui(self)
+        # Keep a reference to the refresh loop to cancel it on exit.
+        self._refresh_task = create_task(self.periodic_refresh_gui(self))
 
-    def get_or_start_maestral_daemon(self) -> MaestralProxy:
-        res = start_maestral_daemon_process(self.config_name)
+    async def get_or_start_maestral_daemon(self) -> MaestralProxy | None:
+        self._daemon_start = call_async(start_maestral_daemon_process, self.config_name)
+        # Don't cancel waiting for the start on exit, exit() needs its result to stop a
+        # daemon which we started.
+        res = await asyncio.shield(self._daemon_start)
 
         if res == Start.Failed:
             title = "Could not start Maestral"
@@ -168,11 +211,10 @@ class MaestralGui(SystemTrayApp):
                 "Could not start or connect to sync daemon. Please try again "
                 "and contact the developer if this issue persists."
             )
-            self.alert(title, message, level="error")
-            stop_maestral_daemon_process(self.config_name)
-            # super().exit() fails on toga-cocoa because the event loop has not yet been
-            # started. Call sys.exit() instead.
-            sys.exit(0)
+            await self.alert_async(title, message, level="error")
+            await call_async(stop_maestral_daemon_process, self.config_name)
+            super().exit()
+            return None
         elif res == Start.AlreadyRunning:
             self._started = False
         elif res == Start.Ok:
@@ -192,7 +234,7 @@ class MaestralGui(SystemTrayApp):
         self.item_status = MenuItem("Setting up...")
 
         self.item_login = MenuItem(
-            "Start on login", checkable=True, action=lambda s: self.autostart.toggle()
+            "Start on login", checkable=True, action=self.on_login_clicked
         )
         self.item_login.checked = self.autostart.enabled
         self.item_help = MenuItem("Help Center", action=self.on_help_clicked)
@@ -249,6 +291,7 @@ class MaestralGui(SystemTrayApp):
             items=[self.item_snooze30, self.item_snooze60, self.item_snooze480]
         )
         self.item_snooze = MenuItem("Snooze Notifications", submenu=self.menu_snooze)
+        self._snooze_header_shown = False
 
         self.item_sync_issues = MenuItem("Show Sync Issues...")
         self.item_rebuild = MenuItem("Rebuild Index...", action=self.on_rebuild_clicked)
@@ -270,7 +313,6 @@ class MaestralGui(SystemTrayApp):
         self.menu.insert(8, self.item_pause)
         self.menu.insert(9, self.item_activity)
         self.menu.insert(11, self.item_snooze)
-        self.menu.insert(12, self.item_sync_issues)
         self.menu.insert(13, self.item_rebuild)
         self.menu.insert(14, MenuItemSeparator())
         self.menu.insert(15, self.item_settings)
@@ -293,6 +335,10 @@ class MaestralGui(SystemTrayApp):
         """Open the Dropbox help website."""
         click.launch(f"{__url__}/docs")
 
+    def on_login_clicked(self, interface, *args, **kwargs) -> None:
+        """Toggle starting Maestral on login."""
+        self.autostart.toggle()
+
     def on_start_stop_clicked(self, interface, *args, **kwargs) -> None:
         """Pause / resume syncing on menu item clicked."""
         try:
@@ -344,21 +390,46 @@ class MaestralGui(SystemTrayApp):
     # ==== periodic refresh of gui =====================================================
 
     async def periodic_refresh_gui(self, interface, *args, **kwargs) -> None:
+        loop = asyncio.get_running_loop()
+        status_changed = True
+        last_gc = loop.time()
+
         while True:
+            t_start = loop.time()
+
             try:
-                await self.update_status(self)
-                await self.update_error(self)
-                await call_async_maestral(self.config_name, "status_change_longpoll")
-                gc.collect()
+                # Only refresh when the long poll reported a change and did not just
+                # time out. Fatal errors are logged by the daemon and also end the
+                # long poll. The menu is additionally refreshed when opened.
+                if status_changed:
+                    await self.update_status(self)
+                    await self.update_error(self)
+                status_changed = await call_async_maestral(
+                    self.config_name, "status_change_longpoll"
+                )
             except CommunicationError:
                 super().exit()
+                return
+
+            # Collect cycles left behind by the ObjC bridge, but not on every status
+            # change while syncing.
+            if t_start - last_gc > self.GC_INTERVAL:
+                gc.collect()
+                last_gc = loop.time()
+
+            elapsed = loop.time() - t_start
+            await asyncio.sleep(max(0.0, self.MIN_REFRESH_INTERVAL - elapsed))
 
     async def update_status(self, interface, *args, **kwargs) -> None:
         """Change icon according to status."""
-        n_sync_errors = len(self.mdbx.sync_errors)
+        menu_visible = self.menu.visible
+
+        # Read the daemon state in a worker thread to keep the GUI responsive.
+        status, n_sync_errors, is_paused = await call_async_proxy(
+            self.config_name, lambda m: self._get_status_info(m, menu_visible)
+        )
+
         has_sync_issues = n_sync_errors > 0
-        status = self.mdbx.status
-        is_paused = self.mdbx.paused
 
         # update icon
         if has_sync_issues and status == IDLE:
@@ -369,7 +440,7 @@ class MaestralGui(SystemTrayApp):
         self.set_icon(new_icon)
 
         # update action texts
-        if self.menu.visible:
+        if menu_visible:
             if has_sync_issues:
                 self.item_sync_issues.action = self.on_sync_issues_clicked
                 self.item_sync_issues.label = f"Show Sync Issues ({n_sync_errors})..."
@@ -378,11 +449,36 @@ class MaestralGui(SystemTrayApp):
                 self.item_sync_issues.label = f"No Sync Issues"
 
             self.item_pause.label = self.RESUME_TEXT if is_paused else self.PAUSE_TEXT
-            self.item_usage.label = self.mdbx.get_state("account", "usage")
-            self.item_email.label = self.mdbx.get_state("account", "email")
 
             self.item_status.label = status
 
+    @staticmethod
+    def _get_status_info(
+        m: MaestralProxy, menu_visible: bool
+    ) -> tuple[str, int, bool | None]:
+        status = m.status
+
+        # Sync issues only affect the icon when idle. Skip fetching them otherwise,
+        # unless the menu is open and shows their count.
+        if status == IDLE or menu_visible:
+            n_sync_errors = len(m.sync_errors)
+        else:
+            n_sync_errors = 0
+
+        is_paused = m.paused if menu_visible else None
+
+        return status, n_sync_errors, is_paused
+
+    async def update_account(self, interface, *args, **kwargs) -> None:
+        """Update account info. This rarely changes, only refresh when opening the menu."""
+        email, usage = await call_async_proxy(self.config_name, self._get_account_info)
+        self.item_email.label = email
+        self.item_usage.label = usage
+
+    @staticmethod
+    def _get_account_info(m: MaestralProxy) -> tuple[str, str]:
+        return m.get_state("account", "email"), m.get_state("account", "usage")
+
     async def update_snoozed(self, interface, *args, **kwargs) -> None:
         minutes = self.mdbx.notification_snooze
 
@@ -392,12 +488,17 @@ class MaestralGui(SystemTrayApp):
             self.item_snooze.label = "Notifications snoozed until {}".format(
                 eta.strftime("%H:%M")
             )
-            self.menu_snooze.insert(0, self.item_snooze_separator)
-            self.menu_snooze.insert(0, self.item_resume_notifications)
+            # Only modify the submenu when snoozing starts or ends.
+            if not self._snooze_header_shown:
+                self.menu_snooze.insert(0, self.item_snooze_separator)
+                self.menu_snooze.insert(0, self.item_resume_notifications)
+                self._snooze_header_shown = True
         else:
             self.item_snooze.label = "Snooze Notifications"
-            self.menu_snooze.remove(self.item_resume_notifications)
-            self.menu_snooze.remove(self.item_snooze_separator)
+            if self._snooze_header_shown:
+                self.menu_snooze.remove(self.item_resume_notifications)
+                self.menu_snooze.remove(self.item_snooze_separator)
+                self._snooze_header_shown = False
 
     async def update_error(self, interface, *args, **kwargs) -> None:
         errs = self.mdbx.fatal_errors
@@ -469,16 +570,35 @@ class MaestralGui(SystemTrayApp):
 
     # ==== quit functions ==============================================================
 
+    def _stop_periodic_tasks(self) -> None:
+        if self._connect_task:
+            self._connect_task.cancel()
+            self._connect_task = None
+
+        if self._refresh_task:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+
+        if self._linked_ui:
+            self.updater.stop_updater()
+
     async def exit_and_stop_daemon(self, interface, *args, **kwargs) -> None:
         """Stops the sync daemon and quits Maestral."""
+        self._stop_periodic_tasks()
         await call_async(stop_maestral_daemon_process, self.config_name)
         super().exit()
 
     def exit(self, interface, *args, **kwargs) -> None:
         """Quits Maestral. Stops the sync daemon only if we started it ourselves."""
         # Note: Keep this method synchrounous for compatibility with the parent class.
+        self._stop_periodic_tasks()
 
         async def async_exit(interface, *args, **kwargs) -> None:
+            if self._daemon_start and not self._daemon_start.done():
+                # Quit while connecting, wait for the daemon to start before stopping.
+                res = await self._daemon_start
+                self._started = res == Start.Ok
+
             if self._started:
                 stop_maestral_daemon_process(self.config_name)
             super(MaestralGui, self).exit()
@@ -22,13 +22,6 @@ from .utils import call_async_maestral, is_empty
 
 class DbxLocationDialog(Dialog):
     WINDOW_WIDTH = 600
-    CONTENT_WIDTH = (
-        WINDOW_WIDTH
-        - Dialog.PADDING_LEFT
-        - Dialog.PADDING_RIGHT
-        - Dialog.ICON_PADDING_RIGHT
-        - Dialog.ICON_SIZE[0]
-    )
 
     COMBOBOX_CHOOSE = "Choose..."
 
@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 # system imports
-from typing import Callable, Iterable
+import os
+import asyncio
+from typing import Any, Callable, Iterable
 
 # external imports
 import toga
 from toga.style import Pack
 from toga.constants import COLUMN, ROW, BOLD, CENTER, TRANSPARENT
-import markdown2
 from maestral import __version__
-from maestral.daemon import MaestralProxy
+from maestral.daemon import MaestralProxy, CommunicationError
+from maestral.exceptions import MaestralApiError
 
 # local imports
 from . import __url__
@@ -22,13 +24,20 @@ from .private.widgets import (
     FollowLinkButton,
 )
 from .private.constants import WORD_WRAP
-from .utils import call_async_maestral
+from .utils import call_async_maestral, create_task
 from .resources import RELEASE_NOTES_CSS_PATH
 
 
 # System native dialogs are the preferred way of alerting the user. However, we use our
 # own dialogs when those to static / inflexible to achieve our goal.
 
+# Styles which do not depend on the dialog size. Widgets copy their style, the same
+# instance can therefore be shared between all dialogs.
+_SPINNER_STYLE = Pack(width=16, height=16, background_color=TRANSPARENT)
+_CONTENT_STYLE = Pack(direction=COLUMN, background_color=TRANSPARENT)
+_ACCESSORY_STYLE = Pack(direction=COLUMN)
+_LINK_STYLE = Pack(padding_bottom=10)
+
 
 class Dialog(Window):
     """
@@ -51,13 +60,36 @@ class Dialog(Window):
         WINDOW_WIDTH - PADDING_LEFT - PADDING_RIGHT - ICON_PADDING_RIGHT - ICON_SIZE[0]
     )
 
+    # Whether to show the message label. Subclasses without a message can disable it
+    # to save space.
+    SHOW_MESSAGE = True
+
+    # Decoded icon images by path, shared between all dialogs.
+    _icon_images: dict[str, toga.Image] = {}
+
+    _did_load_deferred_content = False
+    _did_center = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # Derive the content width from the window size unless given explicitly.
+        if "CONTENT_WIDTH" not in cls.__dict__:
+            cls.CONTENT_WIDTH = (
+                cls.WINDOW_WIDTH
+                - cls.PADDING_LEFT
+                - cls.PADDING_RIGHT
+                - cls.ICON_PADDING_RIGHT
+                - cls.ICON_SIZE[0]
+            )
+
     def __init__(
         self,
         title: str = "Alert",
         message: str = "",
         button_labels: Iterable[str] = ("Ok",),
         default: str = "Ok",
-        accessory_view: toga.Widget = toga.Box(),
+        accessory_view: toga.Widget | None = None,
         icon: toga.Icon | None = None,
         callback: Callable | None = None,
     ):
@@ -92,7 +124,7 @@ class Dialog(Window):
             ),
         )
         self.image = toga.ImageView(
-            icon,
+            self._load_icon_image(icon),
             style=Pack(
                 width=self.ICON_SIZE[0],
                 height=self.ICON_SIZE[1],
@@ -110,9 +142,7 @@ class Dialog(Window):
                 background_color=TRANSPARENT,
             ),
         )
-        self.spinner = toga.ActivityIndicator(
-            style=Pack(width=16, height=16, background_color=TRANSPARENT)
-        )
+        self.spinner = toga.ActivityIndicator(style=_SPINNER_STYLE)
         self.dialog_buttons = DialogButtons(
             labels=button_labels,
             default=default,
@@ -123,22 +153,23 @@ class Dialog(Window):
                 alignment=CENTER,
                 background_color=TRANSPARENT,
             ),
+            leading_widget=self.spinner,
         )
-        self.dialog_buttons.children.insert(0, self.spinner)
 
         self.accessory_view = accessory_view
 
+        # Assemble the content in one go, it is laid out once when set as window
+        # content.
+        content_children = [self.msg_title]
+        if self.SHOW_MESSAGE:
+            content_children.append(self.msg_content)
+        if self.accessory_view is not None:
+            content_children.append(self.accessory_view)
+        content_children.append(self.dialog_buttons)
+
         self.content_box = toga.Box(
-            children=[
-                self.msg_title,
-                self.msg_content,
-                self.accessory_view,
-                self.dialog_buttons,
-            ],
-            style=Pack(
-                direction=COLUMN,
-                background_color=TRANSPARENT,
-            ),
+            children=content_children,
+            style=_CONTENT_STYLE,
         )
 
         self.outer_box = toga.Box(
@@ -156,12 +187,54 @@ class Dialog(Window):
         )
 
         self.content = self.outer_box
-        self.center()
+
+    @classmethod
+    def _load_icon_image(cls, icon: Any) -> Any:
+        """
+        Returns a cached image for icon paths, other image content is returned as is.
+        """
+        if not icon or not isinstance(icon, (str, os.PathLike)):
+            return icon
+
+        path = os.fspath(icon)
+
+        try:
+            return cls._icon_images[path]
+        except KeyError:
+            image = cls._icon_images[path] = toga.Image(path)
+            return image
+
+    def load_deferred_content(self) -> None:
+        """
+        Called once before the dialog is first shown. Subclasses can override this to
+        defer loading expensive content until it is actually displayed.
+        """
+
+    def _ensure_deferred_content(self) -> None:
+        if not self._did_load_deferred_content:
+            self._did_load_deferred_content = True
+            self.load_deferred_content()
+
+    def show(self) -> None:
+        self._ensure_deferred_content()
+        # Sheets are positioned by their parent, only center standalone dialogs. Center
+        # once the content is set and keep the position if the user moves the dialog.
+        if not self._did_center:
+            self._did_center = True
+            self.center()
+        super().show()
+
+    def show_as_sheet(self, window: toga.Window) -> None:
+        self._ensure_deferred_content()
+        super().show_as_sheet(window)
 
 
 class ProgressDialog(Dialog):
     """A dialog to show progress."""
 
+    # save some space...
+    SHOW_MESSAGE = False
+
     def __init__(
         self,
         msg_title: str = "Progress",
@@ -186,9 +259,6 @@ class ProgressDialog(Dialog):
             accessory_view=self.progress_bar,
         )
 
-        # save some space...
-        self.content_box.remove(self.msg_content)
-
 
 class DetailedDialog(Dialog):
     """A generic dialog following cocoa NSAlert style, including a scroll view to
@@ -197,14 +267,6 @@ class DetailedDialog(Dialog):
     WINDOW_WIDTH = 650
     WINDOW_MIN_HEIGHT = 400
 
-    CONTENT_WIDTH = (
-        WINDOW_WIDTH
-        - Dialog.PADDING_LEFT
-        - Dialog.PADDING_RIGHT
-        - Dialog.ICON_PADDING_RIGHT
-        - Dialog.ICON_SIZE[0]
-    )
-
     def __init__(
         self,
         title="Alert",
@@ -232,9 +294,9 @@ class DetailedDialog(Dialog):
                 width=self.CONTENT_WIDTH, height=html_view_height, padding_bottom=15
             ),
         )
-        self.web_view.set_content("", details)
+        self._details = details
         accessory_view = toga.Box(
-            children=[label, self.web_view], style=Pack(direction=COLUMN)
+            children=[label, self.web_view], style=_ACCESSORY_STYLE
         )
 
         super().__init__(
@@ -247,6 +309,9 @@ class DetailedDialog(Dialog):
             accessory_view=accessory_view,
         )
 
+    def load_deferred_content(self) -> None:
+        self.web_view.set_content("", self._details)
+
 
 class UpdateDialog(Dialog):
     """A dialog to show available updates with release notes."""
@@ -254,14 +319,6 @@ class UpdateDialog(Dialog):
     WINDOW_WIDTH = 700
     WINDOW_MIN_HEIGHT = 400
 
-    CONTENT_WIDTH = (
-        WINDOW_WIDTH
-        - Dialog.PADDING_LEFT
-        - Dialog.PADDING_RIGHT
-        - Dialog.ICON_PADDING_RIGHT
-        - Dialog.ICON_SIZE[0]
-    )
-
     def __init__(
         self,
         version: str = "",
@@ -271,7 +328,7 @@ class UpdateDialog(Dialog):
         link_button = FollowLinkButton(
             text="GitHub Releases",
             url=f"{__url__}/download",
-            style=Pack(padding_bottom=10),
+            style=_LINK_STYLE,
         )
 
         label = Label(
@@ -284,20 +341,6 @@ class UpdateDialog(Dialog):
             ),
         )
 
-        html_notes = markdown2.markdown(release_notes)
-
-        with open(RELEASE_NOTES_CSS_PATH) as f:
-            release_notes_css = f.read()
-
-        html_notes = f"""
-        <html>
-        <head>
-        <style>{release_notes_css}</style>
-        </head>
-        <body>{html_notes}</body>
-        </html>
-        """
-
         html_view_height = self.WINDOW_MIN_HEIGHT - Dialog.WINDOW_MIN_HEIGHT - 15
         self.web_view = toga.WebView(
             style=Pack(
@@ -306,9 +349,9 @@ class UpdateDialog(Dialog):
                 padding_bottom=15,
             ),
         )
-        self.web_view.set_content("", html_notes)
+        self._release_notes = release_notes
         accessory_view = toga.Box(
-            children=[link_button, label, self.web_view], style=Pack(direction=COLUMN)
+            children=[link_button, label, self.web_view], style=_ACCESSORY_STYLE
         )
 
         message = (
@@ -326,6 +369,27 @@ class UpdateDialog(Dialog):
         self.msg_content.style.padding_bottom = 0
         self.msg_content.style.height = 40
 
+    def load_deferred_content(self) -> None:
+        # Render the release notes only when they are shown. Import markdown2 here
+        # since it is slow to import and only required for update dialogs.
+        import markdown2
+
+        html_notes = markdown2.markdown(self._release_notes)
+
+        with open(RELEASE_NOTES_CSS_PATH) as f:
+            release_notes_css = f.read()
+
+        html_notes = f"""
+        <html>
+        <head>
+        <style>{release_notes_css}</style>
+        </head>
+        <body>{html_notes}</body>
+        </html>
+        """
+
+        self.web_view.set_content("", html_notes)
+
 
 class RelinkDialog(Dialog):
     """A dialog to relink Maestral."""
@@ -347,8 +411,6 @@ class RelinkDialog(Dialog):
         self.mdbx = mdbx
         self.reason = reason
 
-        url = self.mdbx.get_auth_url()
-
         if self.reason == self.EXPIRED:
             reason_str = "expired"
             title = "Dropbox Access Expired"
@@ -363,9 +425,8 @@ class RelinkDialog(Dialog):
             "authorization token from Dropbox and enter it below."
         ).format(reason_str)
 
-        self.website_button = FollowLinkButton(
-            text="Retrieve Token", url=url, style=Pack(padding_bottom=10)
-        )
+        self.website_button = FollowLinkButton(text="Retrieve Token", style=_LINK_STYLE)
+        self.website_button.enabled = False
         self.token_field = toga.TextInput(
             placeholder="Authorization token",
             on_change=self.token_field_validator,
@@ -380,9 +441,7 @@ class RelinkDialog(Dialog):
                 self.website_button,
                 self.token_field,
             ],
-            style=Pack(
-                direction=COLUMN,
-            ),
+            style=_ACCESSORY_STYLE,
         )
 
         super().__init__(
@@ -393,7 +452,40 @@ class RelinkDialog(Dialog):
             callback=self.on_dialog_press,
         )
 
-        self.dialog_buttons[self.LINK_BTN].enabled = False
+        # Button lookups by label compare the native button titles, keep references.
+        self._link_button = self.dialog_buttons[self.LINK_BTN]
+        self._cancel_button = self.dialog_buttons[self.CANCEL_BTN]
+        self._unlink_button = self.dialog_buttons[self.UNLINK_BTN]
+
+        self._link_button.enabled = False
+
+        # Don't block showing the dialog on the daemon. Keep a reference to cancel
+        # loading when the dialog is closed.
+        self._auth_url_task: asyncio.Task | None = create_task(self._load_auth_url())
+
+    async def _load_auth_url(self) -> None:
+        while True:
+            try:
+                url = await call_async_maestral(self.mdbx.config_name, "get_auth_url")
+            except (ConnectionError, CommunicationError, MaestralApiError) as e:
+                retry = await self.question_dialog(
+                    title="Could not retrieve authorization URL",
+                    message=f"{e}\n\nWould you like to try again?",
+                )
+                if not retry:
+                    break
+            else:
+                self.website_button.url = url
+                self.website_button.enabled = True
+                break
+
+        self._auth_url_task = None
+
+    def close(self) -> None:
+        if self._auth_url_task:
+            self._auth_url_task.cancel()
+            self._auth_url_task = None
+        super().close()
 
     async def on_dialog_press(self, btn_name: str) -> None:
         self.dialog_buttons.enabled = False
@@ -406,6 +498,8 @@ class RelinkDialog(Dialog):
             await call_async_maestral(self.mdbx.config_name, "unlink")
             await self.app.exit_and_stop_daemon(self.app)
         elif btn_name == self.LINK_BTN:
+            # Keep all buttons disabled while the token is verified. Cancelling could
+            # only stop waiting on our side, the daemon would still complete the link.
             await self.do_relink()
 
     async def do_relink(self) -> None:
@@ -431,9 +525,15 @@ class RelinkDialog(Dialog):
                 message="Please check your internet connection.",
             )
 
-        self.dialog_buttons[self.CANCEL_BTN].enabled = True
-        self.dialog_buttons[self.UNLINK_BTN].enabled = True
+        self._enable_input()
+
+    def _enable_input(self) -> None:
+        self._cancel_button.enabled = True
+        self._unlink_button.enabled = True
         self.token_field.enabled = True
 
     def token_field_validator(self, widget: toga.TextInput) -> None:
-        self.dialog_buttons[self.LINK_BTN].enabled = len(widget.value) > 10
+        # Called on every keystroke, only update the button when its state changes.
+        enabled = len(widget.value) > 10
+        if self._link_button.enabled != enabled:
+            self._link_button.enabled = enabled
@@ -133,10 +133,16 @@ class Icon:
         ImageTemplate.StopProgress: NSImageNameStopProgressFreestandingTemplate,
     }
 
-    def __init__(self, interface, path, for_path=None, template=None):
+    # Generic icons only depend on the extension. Icons of existing files may be
+    # custom icons and are not cached.
+    _file_type_images = {}
+    _template_images = {}
+
+    def __init__(self, interface, path, for_path=None, template=None, file_type=None):
         self.interface = interface
         self.interface._impl = self
         self.path = path
+        self._resized_images = {}
 
         if path:
             self.native = NSImage.alloc().initWithContentsOfFile(str(path))
@@ -148,22 +154,54 @@ class Icon:
                 self.native = NSWorkspace.sharedWorkspace.iconForFile(path)
             else:
                 _, extension = osp.splitext(path)
-                self.native = NSWorkspace.sharedWorkspace.iconForFileType(extension)
+                self.native = self._image_for_file_type(extension)
 
         elif template:
-            cocoa_template = Icon._to_cocoa_template[template]
-            self.native = NSImage.imageNamed(cocoa_template)
+            self.native = self._image_for_template(template)
+
+        elif file_type is not None:
+            self.native = self._image_for_file_type(file_type)
 
         self.native.retain()
 
     def __del__(self):
         self.native.autorelease()
 
+    @classmethod
+    def _image_for_file_type(cls, extension):
+        try:
+            return cls._file_type_images[extension]
+        except KeyError:
+            # NSWorkspace expects the extension without the leading dot.
+            image = NSWorkspace.sharedWorkspace.iconForFileType(extension.lstrip("."))
+            image.retain()
+            cls._file_type_images[extension] = image
+            return image
+
+    @classmethod
+    def _image_for_template(cls, template):
+        try:
+            return cls._template_images[template]
+        except KeyError:
+            image = NSImage.imageNamed(cls._to_cocoa_template[template])
+            image.retain()
+            cls._template_images[template] = image
+            return image
+
     def _as_size(self, size):
         image = self.native.copy()
         image.setSize(NSSize(size, size))
         return image
 
+    def _resized(self, size):
+        # Icons are typically shared between many widgets of the same size, e.g., the
+        # reveal buttons in the activity table. Draw each size only once.
+        try:
+            return self._resized_images[size]
+        except KeyError:
+            image = self._resized_images[size] = resize_image_to(self.native, size)
+            return image
+
 
 # ==== image ===========================================================================
 
@@ -258,12 +296,17 @@ class Label(Widget):
         self.native.cell.lineBreakMode = Label._toga_to_cocoa_linebreakmode[value]
 
     def rehint(self):
-        if self.interface.style.width != NONE:
-            self.native.preferredMaxLayoutWidth = float(self.interface.style.width)
+        width = self.interface.style.width
+
+        if width != NONE:
+            # Setting the preferred width invalidates the layout, even if unchanged.
+            width = float(width)
+            if self.native.preferredMaxLayoutWidth != width:
+                self.native.preferredMaxLayoutWidth = width
 
         content_size = self.native.intrinsicContentSize()
 
-        if self.interface.style.width != NONE:
+        if width != NONE:
             self.interface.intrinsic.width = at_least(content_size.width)
             self.interface.intrinsic.height = at_least(content_size.height)
         else:
@@ -284,11 +327,25 @@ class LinkLabel(Widget):
 
         self.native.bezeled = False
 
+        self._displayed = None
+
         # Add the layout constraints
         self.add_constraints()
 
     def _update(self):
         style = self.interface.style
+        displayed = (
+            self.interface.text,
+            self.interface.url,
+            style.font_family,
+            style.font_size,
+        )
+
+        # Text, url and font are all set on creation. Build the string only once.
+        if displayed == self._displayed:
+            return
+
+        self._displayed = displayed
         font = InterfaceFont(style.font_family, style.font_size)
 
         attributes = NSDictionary.dictionaryWithObjects(
@@ -345,7 +402,7 @@ class FreestandingIconButton(TogaButton):
             icon_size = self.interface.style.height
         else:
             icon_size = 16
-        self.native.image = resize_image_to(icon._impl.native, icon_size)
+        self.native.image = icon._impl._resized(icon_size)
         self.native.image.template = True
 
 
@@ -593,7 +650,7 @@ class MenuItem:
 
     def set_icon(self, icon):
         if icon:
-            nsimage = resize_image_to(icon._impl.native, 16)
+            nsimage = icon._impl._resized(16)
             self.native.image = nsimage
         else:
             self.native.image = None
@@ -668,6 +725,9 @@ class Menu:
     def remove_item(self, item_impl):
         self.native.removeItem(item_impl.native)
 
+    def clear(self):
+        self.native.removeAllItems()
+
     @property
     def visible(self):
         return self._visible
@@ -681,13 +741,12 @@ class StatusBarItem:
 
     def __init__(self, interface):
         self.interface = interface
-        self.native = NSStatusBar.systemStatusBar.statusItemWithLength(
-            NSSquareStatusItemLength
-        )
-        self.size = NSStatusBar.systemStatusBar.thickness
+        status_bar = NSStatusBar.systemStatusBar
+        self.native = status_bar.statusItemWithLength(NSSquareStatusItemLength)
+        self.size = status_bar.thickness
 
     def set_icon(self, icon):
-        nsimage = resize_image_to(icon._impl.native, self.size - 2 * self.MARGIN)
+        nsimage = icon._impl._resized(self.size - 2 * self.MARGIN)
         nsimage.template = True
         self.native.button.image = nsimage
 
@@ -42,6 +42,7 @@ class DialogButtons(toga.Box):
     :param str default: A default button to select. Value must match one of the labels
     :param on_press: Callback when any button is pressed. Takes the button
         label as argument.
+    :param leading_widget: An optional widget to show to the left of the buttons.
     """
 
     MIN_BUTTON_WIDTH = 80
@@ -53,13 +54,17 @@ class DialogButtons(toga.Box):
         on_press=None,
         id=None,
         style=None,
+        leading_widget=None,
     ):
         self._buttons = []
         super().__init__(id=id, style=style)
 
         # always display buttons in a row, to the right
         self.style.update(direction=ROW)
-        self.add(Spacer())
+
+        # collect all children to add them at once
+        children = [leading_widget] if leading_widget else []
+        children.append(Spacer())
 
         for label in labels[::-1]:
             style = Pack(padding_left=10, alignment=RIGHT, background_color=TRANSPARENT)
@@ -69,11 +74,12 @@ class DialogButtons(toga.Box):
                 # TODO: remove private API access
                 btn._impl.native.keyEquivalent = "\r"
 
-            self.add(btn)
+            children.append(btn)
             self._buttons.insert(0, btn)
 
             btn.style.width = max(self.MIN_BUTTON_WIDTH, btn.intrinsic.width.value)
 
+        self.add(*children)
         self.on_press = on_press
 
     @property
@@ -383,7 +389,7 @@ class LinkLabel(Widget):
 
     @property
     def url(self):
-        return self._text
+        return self._url
 
     @url.setter
     def url(self, value):
@@ -400,21 +406,55 @@ class Icon(toga.Icon):
     instead of loading an icon from the file content.
 
     :param path: File to path.
+    :param for_path: File or folder to show the icon of.
+    :param template: Platform template image to use.
+    :param file_type: File extension to show the generic icon of.
     """
 
-    def __init__(self, path=None, for_path=None, template=None):
+    def __init__(self, path=None, for_path=None, template=None, file_type=None):
         self.factory = get_platform_factory()
         self.path = path
         self.for_path = for_path
         self.template = template
+        self.file_type = file_type
 
         self._impl = self.factory.Icon(
             interface=self,
             path=self.path,
             for_path=self.for_path,
             template=self.template,
+            file_type=self.file_type,
         )
 
+    _file_type_icons = {}
+
+    @classmethod
+    def for_file_type(cls, path, is_folder=False):
+        """
+        Returns a shared icon for the type of the given file or folder. Files get the
+        generic icon for their extension, custom icons of individual files are not
+        shown. All folders use the generic folder icon.
+
+        :param path: Path of the file or folder.
+        :param is_folder: Whether the path refers to a folder.
+        """
+        if is_folder:
+            key = None
+        else:
+            # Files without an extension share the generic document icon.
+            _, extension = os.path.splitext(path)
+            key = extension.lower()
+
+        try:
+            return cls._file_type_icons[key]
+        except KeyError:
+            if key is None:
+                icon = cls(for_path="/usr")
+            else:
+                icon = cls(file_type=key)
+            cls._file_type_icons[key] = icon
+            return icon
+
 
 # ==== menus and menu items ============================================================
 
@@ -443,6 +483,8 @@ class MenuItem:
         self.factory = get_platform_factory()
         self._impl = self.factory.MenuItem(interface=self)
 
+        self._label = None
+        self._unwrapped_action = object()  # never equal to a given action
         self._checkable = checkable
         self.action = action
         self.label = label
@@ -469,6 +511,10 @@ class MenuItem:
 
     @label.setter
     def label(self, label):
+        # Labels are refreshed periodically, skip updating the native item if they
+        # did not change.
+        if label == self._label:
+            return
         self._label = label
         self._impl.set_label(label)
 
@@ -500,6 +546,11 @@ class MenuItem:
 
     @action.setter
     def action(self, action):
+        # Actions may be set on every status refresh, don't wrap them again.
+        if action == self._unwrapped_action:
+            return
+
+        self._unwrapped_action = action
         self._impl.set_enabled(action is not None)
 
         if self._checkable:
@@ -580,9 +631,9 @@ class Menu:
 
     def clear(self):
         """Clear the menu (removes all items)"""
-        for item in self.items:
-            self._impl.remove_item(item._impl)
-        self._items.clear()
+        if self._items:
+            self._impl.clear()
+            self._items.clear()
 
     @property
     def items(self):
@@ -674,7 +725,11 @@ class Window(toga.Window):
             minimizable=minimizable,
             on_close=on_close,
         )
-        self.is_dialog = is_dialog
+        # New windows already have the default level and animation behaviour, only
+        # change them for dialogs.
+        self._is_dialog = is_dialog
+        if is_dialog:
+            self._impl.set_dialog(True)
 
         if position is None:
             self.center()
@@ -6,14 +6,14 @@ from __future__ import annotations
 import os.path as osp
 import threading
 import asyncio
-from queue import Queue
-from typing import Any, Callable
+from collections import deque
+from typing import Any, Callable, Collection
 
 # external imports
 from toga.sources import Source
 from toga.style import Pack
 from toga.constants import TRANSPARENT
-from maestral.utils.path import is_child, is_equal_or_child
+from maestral.utils.path import is_child
 from maestral.exceptions import (
     NotAFolderError,
     NotFoundError,
@@ -31,6 +31,16 @@ from .private.constants import ON, OFF, MIXED
 from .private.widgets import Icon, Switch
 
 
+def _is_equal_or_child_of_any(path: str, parents: set[str]) -> bool:
+    # Check the path and its ancestors against the set, this requires one lookup
+    # per path component instead of one comparison per parent.
+    while path not in parents:
+        path, _, _ = path.rpartition("/")
+        if not path:
+            return False
+    return True
+
+
 class Node:
     _children: list[Node | PlaceholderNode]
 
@@ -41,18 +51,17 @@ class Node:
         parent: Node | None,
         mdbx: MaestralProxy,
         is_folder: bool,
+        excluded_items: Collection[str] | None = None,
     ) -> None:
         super().__init__()
         self._mdbx = mdbx
         self.path_display = path_display
         self.path_lower = path_lower
         self._is_folder = is_folder
+        self._icon = Icon.for_file_type(path_display, is_folder)
         if is_folder:
-            self._icon = Icon(for_path="/usr")
             self._children = [PlaceholderNode("Loading...", self)]
         else:
-            # use icon for file extension
-            self._icon = Icon(for_path=path_display)
             self._children = []
         self._parent = parent
         self._did_start_loading = False
@@ -64,13 +73,19 @@ class Node:
             style=Pack(background_color=TRANSPARENT),
         )
 
-        self._init_selected()
+        if excluded_items is None:
+            excluded_items = self._get_excluded_items()
+
+        self._init_selected(excluded_items)
 
     # ---- Methods to track user selection ---------------------------------------------
 
-    def _init_selected(self) -> None:
+    def _get_excluded_items(self) -> set[str]:
+        # Lower-case paths once, nodes compare them with their path_lower.
         excluded_items = getattr(self._mdbx, "excluded_items", [])
+        return {path.lower() for path in excluded_items}
 
+    def _init_selected(self, excluded_items: Collection[str]) -> None:
         # Get included state from current list.
         if self.path_lower in excluded_items:
             # Item is excluded.
@@ -94,20 +109,39 @@ class Node:
         else:
             self.included.state = self._original_state
 
+        # A node's parent is always dirty if its selection was inherited.
+        self._subtree_dirty = self.included.state != self._original_state
+
+    def _mark_subtree_dirty(self) -> None:
+        # Mark the node and its ancestors. Ancestors of dirty nodes are always dirty,
+        # we can therefore stop at the first dirty node.
+        node: Node | None = self
+        while node is not None and not node._subtree_dirty:
+            node._subtree_dirty = True
+            node = node.parent
+
     def is_selection_modified(self) -> bool:
-        own_selection_modified = self.included.state != self._original_state
-        child_selection_modified = any(
-            c.is_selection_modified() for c in self._children
-        )
-        return own_selection_modified or child_selection_modified
+        # Walk the tree iteratively, large trees would otherwise require one
+        # Python call per node and may hit the recursion limit. Only descend into
+        # subtrees where the selection may have been changed.
+        stack: list[Node | PlaceholderNode] = [self]
+
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Node):
+                if node.included.state != node._original_state:
+                    return True
+                if node._subtree_dirty:
+                    stack.extend(node._children)
+
+        return False
 
     def get_nodes_with_state(self, state: int) -> list[Node]:
         result = []
-        queue: Queue[Node] = Queue()
-        queue.put(self)
+        queue: deque[Node] = deque([self])
 
-        while not queue.empty():
-            node = queue.get()
+        while queue:
+            node = queue.popleft()
 
             for child in node._children:
                 if isinstance(child, Node):
@@ -116,7 +150,7 @@ class Node:
 
                     if child.included.state == MIXED:
                         # Children may have different state, traverse individually.
-                        queue.put(child)
+                        queue.append(child)
 
         return result
 
@@ -164,6 +198,7 @@ class Node:
     async def _load_children_async(self) -> None:
         try:
             did_clear_children = False
+            excluded_items = self._get_excluded_items()
 
             async for res in generate_async_maestral(
                 self._mdbx.config_name, "list_folder_iterator", self.path_lower
@@ -183,6 +218,7 @@ class Node:
                         parent=self,
                         mdbx=self._mdbx,
                         is_folder=isinstance(e, FolderMetadata),
+                        excluded_items=excluded_items,
                     )
                     for e in res
                 ]
@@ -232,6 +268,7 @@ class Node:
     # ---- GUI callbacks ---------------------------------------------------------------
 
     def on_selected_toggled(self, interface, *args, **kwargs) -> None:
+        self._mark_subtree_dirty()
         self.propagate_selection_to_children(self.included.state)
         self.propagate_selection_to_parent(self.included.state)
 
@@ -239,6 +276,7 @@ class Node:
         if state is not MIXED and len(self._children) > 0:
             for child in self._children:
                 if isinstance(child, Node):
+                    child._subtree_dirty = True
                     child.included.state = state
                     child.propagate_selection_to_children(state)
 
@@ -403,11 +441,14 @@ class SelectiveSyncDialog(SelectiveSyncGui):
         """
         Apply changes to local Dropbox folder.
         """
+        if not self.fs_source.is_selection_modified():
+            return
+
         if not self.mdbx.connected:
             self.on_fs_loading_failed()
             return
 
-        excluded_paths = set(self.mdbx.excluded_items)
+        old_excluded_paths = set(self.mdbx.excluded_items)
 
         # update the state of nodes which are listed in the tree
         # preserve any exclusions which are not shown in the tree
@@ -415,10 +456,12 @@ class SelectiveSyncDialog(SelectiveSyncGui):
         excluded_shown = self.fs_source.get_nodes_with_state(OFF)
         mixed_shown = self.fs_source.get_nodes_with_state(MIXED)
 
-        for node in included_shown:
-            for path in excluded_paths.copy():
-                if is_equal_or_child(path, node.path_lower):
-                    excluded_paths.discard(path)
+        included_paths = {node.path_lower for node in included_shown}
+        excluded_paths = {
+            path
+            for path in old_excluded_paths
+            if not _is_equal_or_child_of_any(path, included_paths)
+        }
 
         for node in mixed_shown:
             excluded_paths.discard(node.path_lower)
@@ -426,7 +469,9 @@ class SelectiveSyncDialog(SelectiveSyncGui):
         for node in excluded_shown:
             excluded_paths.add(node.path_lower)
 
-        self.mdbx.excluded_items = list(excluded_paths)
+        # Setting excluded items triggers a sync, only do so when they changed.
+        if excluded_paths != old_excluded_paths:
+            self.mdbx.excluded_items = list(excluded_paths)
 
     async def on_dialog_pressed(self, btn_name: str) -> None:
         if btn_name == "Update":
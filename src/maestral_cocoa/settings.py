@@ -236,7 +236,9 @@ class SettingsWindow(SettingsGui):
             self._update_interval_mapping,
             key=lambda x: abs(self._update_interval_mapping[x] - update_interval),
         )
-        self.combobox_update_interval.value = closest_key
+        # Selecting an item triggers on_change, only select when it changed.
+        if self.combobox_update_interval.value != closest_key:
+            self.combobox_update_interval.value = closest_key
 
         if FROZEN:
             self._update_cli_tool_button()
@@ -189,7 +189,11 @@ class SetupDialog(SetupDialogGui):
             self.on_failure(self)
 
     def _token_field_validator(self, widget: toga.TextInput) -> None:
-        self.dialog_buttons_link_page["Link"].enabled = len(widget.value) > 10
+        # Called on every keystroke, only update the button when its state changes.
+        enabled = len(widget.value) > 10
+        link_button = self.dialog_buttons_link_page["Link"]
+        if link_button.enabled != enabled:
+            link_button.enabled = enabled
 
     def on_selective_sync_loading_failed(self) -> None:
         self.dialog_buttons_selective_sync_page["Select"].enabled = False
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 # system imports
 import os.path as osp
+import re
 import asyncio
 import urllib.parse
 from typing import Any
@@ -25,76 +26,87 @@ PADDING = 10
 ICON_SIZE = 48
 WINDOW_SIZE = (370, 400)
 
+# Matches any character which urllib.parse.quote() would escape.
+_needs_quoting = re.compile(r"[^A-Za-z0-9/_.~-]").search
+
+
+def _quote_dbx_path(dbx_path: str) -> str:
+    # Most paths contain only safe characters, skip quoting those.
+    if _needs_quoting(dbx_path):
+        return urllib.parse.quote(dbx_path)
+    return dbx_path
+
 
 class SyncIssueView(toga.Box):
+    # Styles are copied by each widget, share the templates between all views.
+    _style = Pack(direction=COLUMN)
+    _image_style = Pack(width=ICON_SIZE, height=ICON_SIZE, padding=(0, 12, 0, 3))
+    _path_style = Pack(padding_bottom=PADDING / 2)
+    _error_style = Pack(
+        font_size=9,
+        width=WINDOW_SIZE[0] - 4 * PADDING - 15 - ICON_SIZE,
+        padding_bottom=PADDING / 2,
+    )
+    _link_local_style = Pack(padding_right=PADDING, font_size=9, height=12)
+    _link_dbx_style = Pack(font_size=9, height=12)
+    _row_style = Pack(direction=ROW)
+    _info_style = Pack(direction=COLUMN, flex=1)
+    _hline_style = Pack(padding=(PADDING, 0, PADDING, 0))
+
     def __init__(self, sync_err: SyncErrorEntry) -> None:
-        super().__init__(style=Pack(direction=COLUMN))
+        super().__init__(style=self._style)
 
         self.sync_err = sync_err
 
+        # There are few sync issues, show the actual icon of each item, including
+        # custom icons, instead of a shared icon for its type.
         icon = Icon(for_path=self.sync_err.local_path)
 
-        image_view = toga.ImageView(
-            style=Pack(
-                width=ICON_SIZE,
-                height=ICON_SIZE,
-                padding=(0, 12, 0, 3),
-            ),
-        )
+        image_view = toga.ImageView(style=self._image_style)
         # TODO: samschott - Find a more elegant solution to set the image to a file icon.
         image_view._impl.native.image = icon._impl.native
 
         path_label = Label(
-            sanitize_string(osp.basename(self.sync_err.dbx_path)),
-            style=Pack(
-                padding_bottom=PADDING / 2,
-            ),
+            sanitize_string(self.sync_err.dbx_path.rpartition("/")[2]),
+            style=self._path_style,
         )
         error_label = Label(
             f"{self.sync_err.title}:\n{self.sync_err.message}",
             linebreak_mode=WORD_WRAP,
-            style=Pack(
-                font_size=9,
-                width=WINDOW_SIZE[0] - 4 * PADDING - 15 - ICON_SIZE,
-                padding_bottom=PADDING / 2,
-            ),
+            style=self._error_style,
         )
 
         link_local = FollowLinkButton(
             "Show in Finder",
             url=self.sync_err.local_path,
             locate=True,
-            style=Pack(
-                padding_right=PADDING,
-                font_size=9,
-                height=12,
-            ),
+            style=self._link_local_style,
         )
         link_local.enabled = osp.exists(self.sync_err.local_path)
 
-        quoted_dbx_path = urllib.parse.quote(self.sync_err.dbx_path)
+        quoted_dbx_path = _quote_dbx_path(self.sync_err.dbx_path)
         dbx_address = f"https://www.dropbox.com/preview{quoted_dbx_path}"
 
         link_dbx = FollowLinkButton(
             "Show Online",
             url=dbx_address,
-            style=Pack(font_size=9, height=12),
+            style=self._link_dbx_style,
         )
 
         link_box = toga.Box(
             children=[link_local, link_dbx],
-            style=Pack(direction=ROW),
+            style=self._row_style,
         )
         info_box = toga.Box(
             children=[path_label, error_label, link_box],
-            style=Pack(direction=COLUMN, flex=1),
+            style=self._info_style,
         )
         content_box = toga.Box(
             children=[image_view, info_box],
-            style=Pack(direction=ROW),
+            style=self._row_style,
         )
 
-        hline = toga.Divider(style=Pack(padding=(PADDING, 0, PADDING, 0)))
+        hline = toga.Divider(style=self._hline_style)
 
         self.add(content_box, hline)
 
@@ -130,12 +142,12 @@ class SyncIssuesWindow(Window):
         self.content = self.scroll_container
         self.center()
 
-        self.refresh_gui()
-
     async def periodic_refresh_gui(self, interface, *args, **kwargs) -> None:
+        # The window is refreshed when shown, wait before the first update.
         while self._refresh:
-            self.refresh_gui()
             await asyncio.sleep(self._refresh_interval)
+            if self._refresh:
+                self.refresh_gui()
 
     def _has_placeholder(self) -> bool:
         return self._placeholder in self.sync_errors_box.children
@@ -151,20 +163,25 @@ class SyncIssuesWindow(Window):
         # add new errors
 
         new_err_paths: set[str] = set()
+        new_widgets: list[SyncIssueView] = []
 
         for error in new_errors:
             new_err_paths.add(error.dbx_path)
             if error.dbx_path not in self._sync_issue_widgets:
                 widget = SyncIssueView(error)
-                self.sync_errors_box.add(widget)
+                new_widgets.append(widget)
                 self._sync_issue_widgets[error.dbx_path] = widget
 
+        if new_widgets:
+            self.sync_errors_box.add(*new_widgets)
+
         # remove old errors
 
-        for dbx_path in self._sync_issue_widgets.copy():
-            if dbx_path not in new_err_paths:
-                widget = self._sync_issue_widgets.pop(dbx_path)
-                self.sync_errors_box.remove(widget)
+        stale_paths = self._sync_issue_widgets.keys() - new_err_paths
+
+        if stale_paths:
+            stale_widgets = [self._sync_issue_widgets.pop(p) for p in stale_paths]
+            self.sync_errors_box.remove(*stale_widgets)
 
         # add placeholder if we don't have any errors
         if len(new_errors) == 0 and not self._has_placeholder():
@@ -175,6 +192,7 @@ class SyncIssuesWindow(Window):
         return True
 
     def show(self) -> None:
+        self.refresh_gui()
         self._refresh = True
         self.app.add_background_task(self.periodic_refresh_gui)
         super().show()
@@ -11,11 +11,14 @@ from maestral.daemon import MaestralProxy, stop_maestral_daemon_process
 from maestral.exceptions import UpdateCheckError
 
 # local imports
-from .utils import call_async_maestral
+from .utils import call_async_maestral, create_task
 from .dialogs import UpdateDialog, ProgressDialog
 from .private.widgets import SystemTrayApp
 
 
+UPDATE_CHECK_PERIOD = 30 * 60
+
+
 class AutoUpdaterBackend(ABC):
     def __init__(self, mdbx: MaestralProxy):
         self.mdbx = mdbx
@@ -25,9 +28,16 @@ class AutoUpdaterBackend(ABC):
         self._start_updater()
         self.started = True
 
+    def stop_updater(self) -> None:
+        self._stop_updater()
+        self.started = False
+
     @abstractmethod
     def _start_updater(self) -> None: ...
 
+    def _stop_updater(self) -> None:
+        pass
+
     @abstractmethod
     def set_update_check_interval(self, value: int) -> None: ...
 
@@ -137,12 +147,34 @@ class AutoUpdaterFallback(AutoUpdaterBackend):
         super().__init__(mdbx)
         self.app = app
         self.config_name = self.mdbx.config_name
+        self._check_handle: asyncio.TimerHandle | None = None
+        self._check_task: asyncio.Task | None = None
+
+        # Last interval set from the GUI, to ignore repeated selections of the same
+        # value. Background checks read the interval from the daemon since it can also
+        # be changed from the command line.
+        self._update_interval: int | None = None
 
     def _start_updater(self) -> None:
-        self.app.add_background_task(self._periodic_check_for_updates)
+        self._schedule_update_check(UPDATE_CHECK_PERIOD)
+
+    def _stop_updater(self) -> None:
+        if self._check_handle:
+            self._check_handle.cancel()
+            self._check_handle = None
+        if self._check_task:
+            self._check_task.cancel()
+            self._check_task = None
 
     def set_update_check_interval(self, value: int) -> None:
-        pass
+        if value == self._update_interval:
+            return
+
+        self._update_interval = value
+        # Check right away to apply the new interval immediately.
+        if self._check_handle:
+            self._check_handle.cancel()
+            self._schedule_update_check(0)
 
     async def check_for_updates(self, interface, *args, **kwargs) -> None:
         progress = ProgressDialog("Checking for Updates")
@@ -180,24 +212,37 @@ class AutoUpdaterFallback(AutoUpdaterBackend):
         self.update_dialog.show()
 
     async def check_for_updates_in_background(self, interface, *args, **kwargs) -> None:
-        last_update_check = self.mdbx.get_state("app", "update_notification_last")
         interval = self.mdbx.get_conf("app", "update_notification_interval")
 
-        if (
-            interval == 0 or time.time() - last_update_check < interval
-        ):  # checks disabled
+        if interval == 0:  # checks disabled
+            return
+
+        last_update_check = self.mdbx.get_state("app", "update_notification_last")
+
+        if time.time() - last_update_check < interval:  # not yet due
             return
 
-        res = await call_async_maestral(self.config_name, "check_for_updates")
+        try:
+            res = await call_async_maestral(self.config_name, "check_for_updates")
+        except UpdateCheckError:
+            # Don't bother the user with failed background checks, retry next time.
+            return
 
         if res.update_available:
             self.mdbx.set_state("app", "update_notification_last", time.time())
             self._show_update_dialog(res.latest_release, res.release_notes)
 
-    async def _periodic_check_for_updates(self, interface, *args, **kwargs) -> None:
-        while True:
-            await asyncio.sleep(30 * 60)
-            await self.check_for_updates_in_background(self)
+    def _schedule_update_check(self, delay: float) -> None:
+        # Use a timer instead of a sleeping coroutine which would keep its frame alive
+        # between checks and is harder to cancel.
+        loop = asyncio.get_event_loop()
+        self._check_handle = loop.call_later(delay, self._on_update_check_due)
+
+    def _on_update_check_due(self) -> None:
+        # Keep a reference, the event loop only holds weak references to tasks.
+        if not self._check_task or self._check_task.done():
+            self._check_task = create_task(self.check_for_updates_in_background(self))
+        self._schedule_update_check(UPDATE_CHECK_PERIOD)
 
 
 class AutoUpdater:
@@ -215,6 +260,9 @@ class AutoUpdater:
     def start_updater(self) -> None:
         self._backend.start_updater()
 
+    def stop_updater(self) -> None:
+        self._backend.stop_updater()
+
     async def check_for_updates(self, interface, *args, **kwargs) -> None:
         await self._backend.check_for_updates(self)
 
@@ -9,7 +9,7 @@ from typing import TypeVar, AsyncGenerator, Any, Callable
 
 # external imports
 from rubicon.objc import ObjCClass
-from maestral.daemon import MaestralProxy
+from maestral.daemon import MaestralProxy, CommunicationError
 
 
 T = TypeVar("T")
@@ -43,6 +43,38 @@ def call_async_maestral(config_name: str, func_name: str, *args) -> Awaitable:
     return loop.run_in_executor(thread_pool_executor, func, *args)
 
 
+# Proxies for call_async_proxy, owned by its single worker thread.
+_proxy_executor = ThreadPoolExecutor(1)
+_proxies: dict[str, MaestralProxy] = {}
+
+
+def call_async_proxy(
+    config_name: str, func: Callable[[MaestralProxy], T]
+) -> Awaitable[T]:
+    """
+    Runs the given function with a long-lived proxy in a worker thread. In contrast to
+    :func:`call_async_maestral`, this does not connect a new proxy for every call and
+    is therefore suited for frequent calls, for instance from periodic refreshes.
+    """
+
+    def inner():
+        try:
+            m = _proxies[config_name]
+        except KeyError:
+            m = _proxies[config_name] = MaestralProxy(config_name)
+
+        try:
+            return func(m)
+        except CommunicationError:
+            # Drop the broken proxy to reconnect on the next call, e.g., after the
+            # daemon was restarted.
+            _proxies.pop(config_name, None)
+            raise
+
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(_proxy_executor, inner)
+
+
 def generate_async_maestral(config_name: str, func_name: str, *args) -> AsyncGenerator:
     loop = asyncio.get_running_loop()
     queue: "asyncio.Queue[Any]" = asyncio.Queue(1)